@@ -8,6 +8,7 @@ private:
   static constexpr size_t BLOCK_SIZE = 100 * 1024;
   std::list<std::vector<char>> blocks_;
   size_t total_size_ = 0;
+  size_t front_offset_ = 0;
 
 public:
   // Simple append operation
@@ -44,10 +45,11 @@ public:
       return 0; // Or throw exception if preferred
     }
 
-    size_t block_idx = pos / BLOCK_SIZE;
+    size_t offset_pos = pos + front_offset_;
+    size_t block_idx = offset_pos / BLOCK_SIZE;
     auto it = blocks_.begin();
     std::advance(it, block_idx);
-    size_t block_pos = pos % BLOCK_SIZE;
+    size_t block_pos = offset_pos % BLOCK_SIZE;
 
     return (*it)[block_pos];
   }
@@ -58,10 +60,11 @@ public:
       return; // Or throw exception if preferred
     }
 
-    size_t block_idx = pos / BLOCK_SIZE;
+    size_t offset_pos = pos + front_offset_;
+    size_t block_idx = offset_pos / BLOCK_SIZE;
     auto it = blocks_.begin();
     std::advance(it, block_idx);
-    size_t block_pos = pos % BLOCK_SIZE;
+    size_t block_pos = offset_pos % BLOCK_SIZE;
 
     (*it)[block_pos] = value;
   }
@@ -73,6 +76,32 @@ public:
   void clear() {
     blocks_.clear();
     total_size_ = 0;
+    front_offset_ = 0;
+  }
+
+  // Remove len bytes from the front without copying the rest
+  void consume(size_t len) {
+    if (len >= total_size_) {
+      clear();
+      return;
+    }
+
+    total_size_ -= len;
+    front_offset_ += len;
+    while (front_offset_ >= BLOCK_SIZE) {
+      blocks_.pop_front();
+      front_offset_ -= BLOCK_SIZE;
+    }
+  }
+
+  // Contiguous bytes at the front, valid until the next modification
+  const char *frontData() const {
+    return blocks_.empty() ? nullptr : blocks_.front().data() + front_offset_;
+  }
+
+  // Number of contiguous bytes available from frontData()
+  size_t frontSize() const {
+    return blocks_.empty() ? 0 : blocks_.front().size() - front_offset_;
   }
 
   // Append data from containers with .data() and .size()
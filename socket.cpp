@@ -18,15 +18,20 @@ Socket::Socket() : Pollable() {
         }
       }
       if ((revents & POLLOUT) && write_buffer.size() > 0) {
-        std::vector<char> temp_buffer;
-        temp_buffer.reserve(std::min(write_buffer.size(), size_t(1024)));
-        for (size_t i = 0; i < temp_buffer.capacity(); ++i) {
-          temp_buffer.push_back(write_buffer.getAt(i));
-        }
-        ssize_t bytes_written =
-            ::write(file_descriptor, temp_buffer.data(), temp_buffer.size());
-        if (bytes_written > 0) {
-          write_buffer.clear();
+        // Flush straight from the buffer's front block until the kernel
+        // would block; MSG_DONTWAIT keeps a slow peer from stalling the loop
+        while (write_buffer.size() > 0) {
+          size_t chunk_size = write_buffer.frontSize();
+          ssize_t bytes_written = ::send(file_descriptor,
+                                         write_buffer.frontData(), chunk_size,
+                                         MSG_DONTWAIT);
+          if (bytes_written <= 0) {
+            break;
+          }
+          write_buffer.consume(static_cast<size_t>(bytes_written));
+          if (static_cast<size_t>(bytes_written) < chunk_size) {
+            break;
+          }
         }
       }
     }
@@ -6,76 +6,116 @@ Tests both the echo route (/) and chat route (/chat).
 Can test both standalone WebSocket server (port 8765) and unified server (port 8080).
 """
 
+import argparse
 import asyncio
-import websockets
+import concurrent.futures
+import hashlib
+import socket
+import statistics
 import sys
-import argparse
+import time
+
+import websockets
 
 
 # This intend to used to test websocket_server_example.cpp (port 8765)
 # or unified_server_example.cpp (port 8080)
 
+# Numeric IPv4 host: skips getaddrinfo and any IPv6-first fallback for "localhost"
+HOST = "127.0.0.1"
+SOCKET_BUFFER_SIZE = 1 << 20
+
+# Test connections are short-lived: no keepalive pings, no incoming-frame backpressure
+CONNECT_OPTIONS = dict(ping_interval=None, ping_timeout=None, close_timeout=1, max_queue=None)
+
+# Seconds to wait for each echo before giving up on a connection
+RECV_TIMEOUT = 10
+
+# Default cap on opening handshakes in flight during the multi-connection test
+MAX_CONCURRENT_HANDSHAKES = 64
+
+
+async def open_socket(host, port):
+    """Connect a TCP socket with Nagle disabled and large kernel buffers"""
+    sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+    sock.setsockopt(socket.SOL_SOCKET, socket.SO_SNDBUF, SOCKET_BUFFER_SIZE)
+    sock.setsockopt(socket.SOL_SOCKET, socket.SO_RCVBUF, SOCKET_BUFFER_SIZE)
+    sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+    sock.setblocking(False)
+    try:
+        await asyncio.get_running_loop().sock_connect(sock, (host, port))
+    except BaseException:
+        sock.close()
+        raise
+    return sock
+
+
 async def test_echo_route(port=8765, path="/"):
     """Test the echo route"""
-    uri = f"ws://localhost:{port}{path}"
-    print(f"\n=== Testing Echo Route: {uri} ===")
+    tag = "[echo]"
+    uri = f"ws://{HOST}:{port}{path}"
+    print(f"\n{tag} === Testing Echo Route: {uri} ===")
 
     try:
-        async with websockets.connect(uri) as websocket:
-            print("✓ Connected to echo server")
+        sock = await open_socket(HOST, port)
+        async with websockets.connect(uri, sock=sock, **CONNECT_OPTIONS) as websocket:
+            print(f"{tag} ✓ Connected to echo server")
 
             # Test 1: Send text message
             test_message = "Hello, WebSocket Echo Server!"
-            print(f"→ Sending text: {test_message}")
+            print(f"{tag} → Sending text: {test_message}")
             await websocket.send(test_message)
 
-            response = await websocket.recv()
-            print(f"← Received: {response}")
+            # Receive raw bytes to skip UTF-8 decoding of the echoed frame
+            response = await websocket.recv(decode=False)
+            print(f"{tag} ← Received: {response.decode(errors='replace')}")
 
-            if response == test_message:
-                print("✓ Echo test passed!")
+            if response == test_message.encode():
+                print(f"{tag} ✓ Echo test passed!")
             else:
-                print(f"✗ Echo test failed! Expected: {test_message}, Got: {response}")
+                print(f"{tag} ✗ Echo test failed! Expected: {test_message}, Got: {response}")
 
             # Test 2: Send binary message
             binary_data = b"Binary test data \x00\x01\x02\x03"
-            print(f"\n→ Sending binary data ({len(binary_data)} bytes)")
+            print(f"\n{tag} → Sending binary data ({len(binary_data)} bytes)")
             await websocket.send(binary_data)
 
             binary_response = await websocket.recv()
-            print(f"← Received binary data ({len(binary_response)} bytes)")
+            print(f"{tag} ← Received binary data ({len(binary_response)} bytes)")
 
             if binary_response == binary_data:
-                print("✓ Binary echo test passed!")
+                print(f"{tag} ✓ Binary echo test passed!")
             else:
-                print(f"✗ Binary echo test failed!")
+                print(f"{tag} ✗ Binary echo test failed!")
 
             # Test 3: Multiple messages
-            print("\n→ Sending multiple messages...")
+            print(f"\n{tag} → Sending multiple messages...")
             for i in range(3):
                 msg = f"Message #{i+1}"
                 await websocket.send(msg)
                 response = await websocket.recv()
-                print(f"  {i+1}. Sent: {msg} → Received: {response}")
+                print(f"{tag}   {i+1}. Sent: {msg} → Received: {response}")
 
-            print("✓ Multiple message test completed!")
+            print(f"{tag} ✓ Multiple message test completed!")
 
     except ConnectionRefusedError:
-        print("✗ Connection refused. Is the server running on port 8765?")
+        print(f"{tag} ✗ Connection refused. Is the server running on port 8765?")
         sys.exit(1)
     except Exception as e:
-        print(f"✗ Error: {e}")
+        print(f"{tag} ✗ Error: {e}")
         sys.exit(1)
 
 
 async def test_chat_route(port=8765, path="/chat"):
     """Test the chat route"""
-    uri = f"ws://localhost:{port}{path}"
-    print(f"\n=== Testing Chat Route: {uri} ===")
+    tag = "[chat]"
+    uri = f"ws://{HOST}:{port}{path}"
+    print(f"\n{tag} === Testing Chat Route: {uri} ===")
 
     try:
-        async with websockets.connect(uri) as websocket:
-            print("✓ Connected to chat server")
+        sock = await open_socket(HOST, port)
+        async with websockets.connect(uri, sock=sock, **CONNECT_OPTIONS) as websocket:
+            print(f"{tag} ✓ Connected to chat server")
 
             # Send some chat messages
             messages = [
@@ -84,74 +124,196 @@ async def test_chat_route(port=8765, path="/chat"):
                 "This is a test message"
             ]
 
-            for msg in messages:
-                print(f"→ Sending: {msg}")
+            # Precompute 8-byte digests of the expected replies and check raw bytes
+            expected_digests = [
+                hashlib.blake2b(f"Chat response: {msg}".encode(), digest_size=8).digest()
+                for msg in messages
+            ]
+
+            for msg, expected_digest in zip(messages, expected_digests):
+                print(f"{tag} → Sending: {msg}")
                 await websocket.send(msg)
 
-                response = await websocket.recv()
-                print(f"← Received: {response}")
+                response = await websocket.recv(decode=False)
+                print(f"{tag} ← Received {len(response)} bytes")
 
-                expected = f"Chat response: {msg}"
-                if response == expected:
-                    print(f"✓ Chat response correct!")
+                if hashlib.blake2b(response, digest_size=8).digest() == expected_digest:
+                    print(f"{tag} ✓ Chat response correct!")
                 else:
-                    print(f"✗ Unexpected response! Expected: {expected}")
+                    print(f"{tag} ✗ Unexpected response! Expected: Chat response: {msg}, "
+                          f"Got: {response.decode(errors='replace')}")
 
     except ConnectionRefusedError:
-        print("✗ Connection refused. Is the server running on port 8765?")
+        print(f"{tag} ✗ Connection refused. Is the server running on port 8765?")
         sys.exit(1)
     except Exception as e:
-        print(f"✗ Error: {e}")
+        print(f"{tag} ✗ Error: {e}")
         sys.exit(1)
 
 
-async def test_multiple_connections(port=8765, path="/", num_connections=10, messages_per_conn=5):
+async def test_multiple_connections(port=8765, path="/", num_connections=10, messages_per_conn=5,
+                                    verbose=False, max_handshakes=MAX_CONCURRENT_HANDSHAKES):
     """Test multiple concurrent WebSocket connections"""
-    uri = f"ws://localhost:{port}{path}"
+    uri = f"ws://{HOST}:{port}{path}"
     print(f"\n=== Testing Multiple Connections: {uri} ===")
     print(f"Creating {num_connections} concurrent connections...")
     print(f"Each connection will send {messages_per_conn} messages\n")
 
-    import time
-    start_time = time.time()
+    start_ns = time.perf_counter_ns()
+    completion_ns = []
+
+    # Bound in-flight opening handshakes so large -c runs do not flood the server
+    handshake_sem = asyncio.Semaphore(max_handshakes)
 
     async def handle_single_connection(conn_id):
         """Handle a single connection"""
         try:
-            async with websockets.connect(uri) as websocket:
-                print(f"✓ Connection {conn_id}: Connected")
+            async with handshake_sem:
+                sock = await open_socket(HOST, port)
+                websocket = await websockets.connect(uri, sock=sock, compression=None, max_size=None,
+                                                     **CONNECT_OPTIONS)
+
+            async with websocket:
+                # Bind hot-loop methods once instead of looking them up per message
+                send = websocket.send
+                recv = websocket.recv
+                if verbose:
+                    print(f"✓ Connection {conn_id}: Connected")
 
-                messages_sent = 0
                 messages_received = 0
+                sent_hasher = hashlib.blake2b(digest_size=16)
+                recv_hasher = hashlib.blake2b(digest_size=16)
+
+                # Encode once and send as binary frames; the echo comes back as the same bytes
+                msgs = [f"Connection-{conn_id} Message-{i+1}".encode() for i in range(messages_per_conn)]
+
+                # Queue every send right after the handshake and start draining echoes
+                # without waiting for the writes, so they batch into the first segments
+                send_tasks = [asyncio.create_task(send(msg)) for msg in msgs]
+
+                # Hash both streams and verify the echo once after the run
+                sent_update = sent_hasher.update
+                recv_update = recv_hasher.update
+                try:
+                    for msg in msgs:
+                        async with asyncio.timeout(RECV_TIMEOUT):
+                            response = await recv()
+                        messages_received += 1
+                        sent_update(msg)
+                        recv_update(response)
+
+                    await asyncio.gather(*send_tasks)
+                finally:
+                    for task in send_tasks:
+                        task.cancel()
+                    await asyncio.gather(*send_tasks, return_exceptions=True)
+                messages_sent = len(send_tasks)
+
+                completion_ns.append(time.perf_counter_ns() - start_ns)
+
+                echo_ok = sent_hasher.digest() == recv_hasher.digest()
+                if echo_ok:
+                    print(f"✓ Connection {conn_id}: {messages_sent} sent, {messages_received} received")
+                else:
+                    print(f"✗ Connection {conn_id}: {messages_sent} sent, {messages_received} received, echo mismatch")
+                return echo_ok
+
+        except TimeoutError:
+            print(f"✗ Connection {conn_id}: No echo within {RECV_TIMEOUT}s")
+            return False
+        except Exception as e:
+            print(f"✗ Connection {conn_id}: Error - {e}")
+            return False
+
+    # Create all connections concurrently
+    async with asyncio.TaskGroup() as tg:
+        tasks = [tg.create_task(handle_single_connection(i+1)) for i in range(num_connections)]
+    results = [t.result() for t in tasks]
+
+    elapsed_time = (time.perf_counter_ns() - start_ns) / 1e9
+    print_multiple_results(num_connections, messages_per_conn, results, elapsed_time, completion_ns)
+
+
+def test_multiple_connections_sync(port=8765, path="/", num_connections=10, messages_per_conn=5,
+                                   verbose=False):
+    """Test multiple connections with the synchronous websocket-client on a thread pool"""
+    try:
+        from websocket import WebSocketTimeoutException, create_connection
+    except ImportError:
+        print("✗ websocket-client is not installed (pip install websocket-client)")
+        sys.exit(1)
+
+    uri = f"ws://{HOST}:{port}{path}"
+    print(f"\n=== Testing Multiple Connections (sync client): {uri} ===")
+    print(f"Creating {num_connections} concurrent connections...")
+    print(f"Each connection will send {messages_per_conn} messages\n")
+
+    start_ns = time.perf_counter_ns()
+    completion_ns = []
+
+    def handle_single_connection(conn_id):
+        """Handle a single connection on a worker thread"""
+        try:
+            ws = create_connection(uri, timeout=RECV_TIMEOUT,
+                                   sockopt=((socket.IPPROTO_TCP, socket.TCP_NODELAY, 1),))
+        except Exception as e:
+            print(f"✗ Connection {conn_id}: Error - {e}")
+            return False
 
-                for i in range(messages_per_conn):
-                    msg = f"Connection-{conn_id} Message-{i+1}"
-                    await websocket.send(msg)
-                    messages_sent += 1
+        try:
+            if verbose:
+                print(f"✓ Connection {conn_id}: Connected")
 
-                    response = await websocket.recv()
-                    messages_received += 1
+            send = ws.send_binary
+            recv = ws.recv
+            sent_hasher = hashlib.blake2b(digest_size=16)
+            recv_hasher = hashlib.blake2b(digest_size=16)
+            sent_update = sent_hasher.update
+            recv_update = recv_hasher.update
 
-                    # Verify echo response
-                    if response == msg:
-                        print(f"  Connection {conn_id}: Message {i+1}/{messages_per_conn} ✓")
-                    else:
-                        print(f"  Connection {conn_id}: Message {i+1}/{messages_per_conn} ✗ (Expected: {msg}, Got: {response})")
+            msgs = [f"Connection-{conn_id} Message-{i+1}".encode() for i in range(messages_per_conn)]
+            for msg in msgs:
+                send(msg)
+                sent_update(msg)
+                recv_update(recv())
 
-                print(f"✓ Connection {conn_id}: Completed ({messages_sent} sent, {messages_received} received)")
-                return True
+            completion_ns.append(time.perf_counter_ns() - start_ns)
+
+            echo_ok = sent_hasher.digest() == recv_hasher.digest()
+            if echo_ok:
+                print(f"✓ Connection {conn_id}: {len(msgs)} sent, {len(msgs)} received")
+            else:
+                print(f"✗ Connection {conn_id}: {len(msgs)} sent, {len(msgs)} received, echo mismatch")
+            return echo_ok
 
+        except WebSocketTimeoutException:
+            print(f"✗ Connection {conn_id}: No echo within {RECV_TIMEOUT}s")
+            return False
         except Exception as e:
             print(f"✗ Connection {conn_id}: Error - {e}")
             return False
+        finally:
+            ws.close()
+
+    with concurrent.futures.ThreadPoolExecutor(max_workers=max(1, num_connections)) as executor:
+        results = list(executor.map(handle_single_connection, range(1, num_connections + 1)))
+
+    elapsed_time = (time.perf_counter_ns() - start_ns) / 1e9
+    print_multiple_results(num_connections, messages_per_conn, results, elapsed_time, completion_ns)
 
-    # Create all connections concurrently
-    tasks = [handle_single_connection(i+1) for i in range(num_connections)]
-    results = await asyncio.gather(*tasks, return_exceptions=True)
 
-    # Calculate statistics
-    elapsed_time = time.time() - start_time
-    successful = sum(1 for r in results if r is True)
+def print_multiple_results(num_connections, messages_per_conn, results, elapsed_time, completion_ns):
+    """Print the multiple connection test summary"""
+    # Imported here so the plain echo/chat suite does not pay for loading NumPy
+    try:
+        import numpy as np
+    except ImportError:
+        np = None
+
+    if np is not None:
+        successful = int(np.fromiter((r is True for r in results), dtype=bool, count=len(results)).sum())
+    else:
+        successful = sum(1 for r in results if r is True)
     failed = num_connections - successful
     total_messages = num_connections * messages_per_conn
 
@@ -166,6 +328,14 @@ async def test_multiple_connections(port=8765, path="/", num_connections=10, mes
     print(f"  Total messages received: {successful * messages_per_conn}")
     print(f"  Time elapsed:           {elapsed_time:.2f}s")
     print(f"  Messages per second:    {total_messages / elapsed_time:.2f}")
+    if len(completion_ns) >= 2:
+        # NumPy's default linear interpolation matches the 'inclusive' quantiles below
+        if np is not None:
+            p50, p95, p99 = np.percentile(np.asarray(completion_ns, dtype=np.int64), [50, 95, 99])
+        else:
+            cuts = statistics.quantiles(sorted(completion_ns), n=100, method='inclusive')
+            p50, p95, p99 = cuts[49], cuts[94], cuts[98]
+        print(f"  Completion p50/p95/p99: {p50 / 1e6:.2f} / {p95 / 1e6:.2f} / {p99 / 1e6:.2f} ms")
     print(f"{'='*60}")
 
     if successful == num_connections:
@@ -174,8 +344,16 @@ async def test_multiple_connections(port=8765, path="/", num_connections=10, mes
         print(f"✗ {failed} connection(s) failed")
 
 
-async def main():
-    """Main function to run all tests"""
+def positive_int(value):
+    """argparse type for integers >= 1"""
+    number = int(value)
+    if number < 1:
+        raise argparse.ArgumentTypeError(f"must be a positive integer, got {value}")
+    return number
+
+
+def parse_args():
+    """Parse command line arguments"""
     parser = argparse.ArgumentParser(
         description='WebSocket client test suite for C++ WebSocket server',
         formatter_class=argparse.RawDescriptionHelpFormatter,
@@ -188,6 +366,8 @@ Examples:
   %(prog)s -m -c 50 -n 10             # Test 50 connections, 10 messages each
   %(prog)s -m -c 20 -p 8080           # Test 20 connections on port 8080
   %(prog)s -m -c 100 -p 9876          # Test 100 connections on port 9876
+  %(prog)s -m -c 100 --uvloop         # Run the stress test on uvloop
+  %(prog)s -m -c 100 --sync-client    # Run the stress test with websocket-client threads
         '''
     )
 
@@ -201,9 +381,31 @@ Examples:
                         help='Number of concurrent connections (default: 10, use with -m)')
     parser.add_argument('-n', '--messages', type=int, default=5, metavar='M',
                         help='Messages per connection (default: 5, use with -m)')
+    parser.add_argument('--max-concurrent-handshakes', type=positive_int, default=None, metavar='K',
+                        help=f'Maximum opening handshakes in flight (default: {MAX_CONCURRENT_HANDSHAKES}, use with -m)')
+    parser.add_argument('-v', '--verbose', action='store_true',
+                        help='Print per-connection details (use with -m)')
+    parser.add_argument('--sync-client', action='store_true',
+                        help='Use the synchronous websocket-client package on threads (use with -m)')
+    parser.add_argument('--uvloop', action='store_true',
+                        help='Run on the uvloop event loop if installed')
 
     args = parser.parse_args()
 
+    # The sync client runs on plain threads without an event loop
+    if args.sync_client:
+        if args.uvloop:
+            parser.error('--uvloop cannot be combined with --sync-client')
+        if args.max_concurrent_handshakes is not None:
+            parser.error('--max-concurrent-handshakes cannot be combined with --sync-client')
+    if args.max_concurrent_handshakes is None:
+        args.max_concurrent_handshakes = MAX_CONCURRENT_HANDSHAKES
+
+    return args
+
+
+async def main(args):
+    """Main function to run all tests"""
     # Use specified port and path
     port = args.port
     echo_path = args.path
@@ -213,17 +415,16 @@ Examples:
     if args.multi:
         # Multiple connection test
         print(f"Testing on port {port}")
-        await test_multiple_connections(port, echo_path, args.connections, args.messages)
+        await test_multiple_connections(port, echo_path, args.connections, args.messages,
+                                        args.verbose, args.max_concurrent_handshakes)
     else:
         # Run automated tests
         print("=" * 60)
         print(f"WebSocket Client Test Suite - Port {port}")
         print("=" * 60)
 
-        await test_echo_route(port, echo_path)
-        await asyncio.sleep(0.5)  # Small delay between tests
-
-        await test_chat_route(port, chat_path)
+        # Echo and chat use separate connections, so run them side by side
+        await asyncio.gather(test_echo_route(port, echo_path), test_chat_route(port, chat_path))
 
         print("\n" + "=" * 60)
         print("All tests completed!")
@@ -235,4 +436,23 @@ Examples:
 
 
 if __name__ == "__main__":
-    asyncio.run(main())
+    args = parse_args()
+
+    if args.multi and args.sync_client:
+        # Blocking thread-pool test, dispatched before any event loop exists
+        print(f"Testing on port {args.port}")
+        test_multiple_connections_sync(args.port, args.path, args.connections, args.messages,
+                                       args.verbose)
+        sys.exit(0)
+
+    loop_factory = None
+    if args.uvloop:
+        try:
+            import uvloop
+            loop_factory = uvloop.new_event_loop
+        except ImportError:
+            print("✗ uvloop is not installed, using the default event loop")
+
+    with asyncio.Runner(loop_factory=loop_factory) as runner:
+        runner.run(main(args))
+
@@ -9,7 +9,7 @@ import logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
-async def echo_handler(websocket, path):
+async def echo_handler(websocket, path=None):
     """Handle WebSocket connections and echo messages back"""
     client_addr = websocket.remote_address
     logger.info(f"Client connected from {client_addr}")
@@ -73,7 +73,7 @@ void WebSocketServer::handleConnection(Socket &socket) {
 
     if (conn.status == WebSocketConnectionStatus::OPEN) {
       conn.handleSocketData(data);
-    } else {
+    } else if (conn.status == WebSocketConnectionStatus::CONNECTING) {
       // Handle HTTP upgrade request
       String data_str(
           data.data,
@@ -371,17 +371,36 @@ void WebSocketConnection::close(uint16_t code, const std::string &reason) {
 void WebSocketConnection::handleSocketData(const BufferView &data) {
   LOG("[WebSocketConnection] Processing WebSocket frame data, size: ",
       data.size);
-  std::vector<uint8_t> frame_data(
-      data.data,
-      data.data + data.size); // MEMORY ALLOCATION: vector copy of frame data
-  // OPTIMIZATION STRATEGY: Parse directly from BufferView, no intermediate copy
-  // needed
-  parseFrame(frame_data);
+  receive_buffer.insert(
+      receive_buffer.end(), data.data,
+      data.data + data.size); // MEMORY ALLOCATION: vector growth for pending
+                              // frame bytes
+  // OPTIMIZATION STRATEGY: Parse in place from BufferView when no partial
+  // frame is pending
+
+  size_t consumed = 0;
+  while (status != WebSocketConnectionStatus::CLOSED) {
+    size_t frame_size = parseFrame(receive_buffer, consumed);
+    if (frame_size == 0)
+      break;
+    consumed += frame_size;
+  }
+
+  if (status == WebSocketConnectionStatus::CLOSED) {
+    receive_buffer.clear();
+  } else {
+    receive_buffer.erase(receive_buffer.begin(),
+                         receive_buffer.begin() + consumed);
+  }
 }
 
-void WebSocketConnection::parseFrame(const std::vector<uint8_t> &data) {
-  if (data.size() < 2)
-    return;
+size_t WebSocketConnection::parseFrame(const std::vector<uint8_t> &data,
+                                       size_t start) {
+  const uint8_t *bytes = data.data() + start;
+  size_t size = data.size() - start;
+
+  if (size < 2)
+    return 0;
 
   WebSocketFrame frame; // MEMORY ALLOCATION: WebSocketFrame struct (contains
                         // vector payload)
@@ -389,55 +408,61 @@ void WebSocketConnection::parseFrame(const std::vector<uint8_t> &data) {
   // buffer per connection
 
   // Parse first byte
-  frame.fin = (data[0] & 0x80) != 0;
-  frame.rsv1 = (data[0] & 0x40) != 0;
-  frame.rsv2 = (data[0] & 0x20) != 0;
-  frame.rsv3 = (data[0] & 0x10) != 0;
-  frame.opcode = static_cast<WebSocketOpcode>(data[0] & 0x0F);
+  frame.fin = (bytes[0] & 0x80) != 0;
+  frame.rsv1 = (bytes[0] & 0x40) != 0;
+  frame.rsv2 = (bytes[0] & 0x20) != 0;
+  frame.rsv3 = (bytes[0] & 0x10) != 0;
+  frame.opcode = static_cast<WebSocketOpcode>(bytes[0] & 0x0F);
 
   // Parse second byte
-  frame.masked = (data[1] & 0x80) != 0;
-  uint8_t payload_len = data[1] & 0x7F;
+  frame.masked = (bytes[1] & 0x80) != 0;
+  uint8_t payload_len = bytes[1] & 0x7F;
 
   size_t offset = 2;
 
   // Parse extended payload length
   if (payload_len == 126) {
-    if (data.size() < offset + 2)
-      return;
-    frame.payload_length = (data[offset] << 8) | data[offset + 1];
+    if (size < offset + 2)
+      return 0;
+    frame.payload_length = (bytes[offset] << 8) | bytes[offset + 1];
     offset += 2;
   } else if (payload_len == 127) {
-    if (data.size() < offset + 8)
-      return;
+    if (size < offset + 8)
+      return 0;
     frame.payload_length = 0;
     for (int i = 0; i < 8; ++i) {
-      frame.payload_length = (frame.payload_length << 8) | data[offset + i];
+      frame.payload_length = (frame.payload_length << 8) | bytes[offset + i];
     }
     offset += 8;
   } else {
     frame.payload_length = payload_len;
   }
 
+  // Refuse frames we would have to buffer without bound
+  if (frame.payload_length > MAX_WEBSOCKET_PAYLOAD_SIZE) {
+    close(1009, "Message too big");
+    return 0;
+  }
+
   // Parse masking key
   if (frame.masked) {
-    if (data.size() < offset + 4)
-      return;
-    frame.masking_key = (data[offset] << 24) | (data[offset + 1] << 16) |
-                        (data[offset + 2] << 8) | data[offset + 3];
+    if (size < offset + 4)
+      return 0;
+    frame.masking_key = (bytes[offset] << 24) | (bytes[offset + 1] << 16) |
+                        (bytes[offset + 2] << 8) | bytes[offset + 3];
     offset += 4;
   }
 
   // Parse payload
-  if (data.size() < offset + frame.payload_length)
-    return;
+  if (size < offset + frame.payload_length)
+    return 0;
 
   frame.payload.resize(
       frame.payload_length); // MEMORY ALLOCATION: vector resize for payload
   // OPTIMIZATION STRATEGY: Use connection-local payload buffer, reuse across
   // frames
   for (size_t i = 0; i < frame.payload_length; ++i) {
-    frame.payload[i] = data[offset + i];
+    frame.payload[i] = bytes[offset + i];
     if (frame.masked) {
       frame.payload[i] ^= ((frame.masking_key >> ((3 - (i % 4)) * 8)) & 0xFF);
     }
@@ -498,6 +523,8 @@ void WebSocketConnection::parseFrame(const std::vector<uint8_t> &data) {
   default:
     break;
   }
+
+  return offset + frame.payload_length;
 }
 
 std::vector<uint8_t> WebSocketConnection::buildFrame(const std::string &message,
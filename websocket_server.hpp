@@ -19,6 +19,8 @@ enum class WebSocketOpcode {
 
 enum class WebSocketConnectionStatus { CONNECTING, OPEN, CLOSING, CLOSED };
 
+constexpr uint64_t MAX_WEBSOCKET_PAYLOAD_SIZE = 16 * 1024 * 1024; // 16MB per frame
+
 struct WebSocketFrame {
   bool fin = true;
   bool rsv1 = false;
@@ -36,6 +38,7 @@ struct WebSocketConnection {
   WebSocketConnectionStatus status = WebSocketConnectionStatus::CONNECTING;
   String path = "";
   StringMap<String> headers = {};
+  Vector<uint8_t> receive_buffer = {};
 
   using MessageCallback = Function<void(WebSocketConnection &, const String &)>;
   using BinaryCallback =
@@ -58,7 +61,8 @@ struct WebSocketConnection {
 
   // Internal methods
   void handleSocketData(const BufferView &data);
-  void parseFrame(const Vector<uint8_t> &data);
+  // Returns bytes consumed, 0 if the frame at start is incomplete
+  size_t parseFrame(const Vector<uint8_t> &data, size_t start);
   Vector<uint8_t> buildFrame(const String &message, WebSocketOpcode opcode);
   Vector<uint8_t> buildFrame(const Vector<uint8_t> &data,
                              WebSocketOpcode opcode);